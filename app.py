@@ -9,17 +9,25 @@ fast file operations, real-time search and filtering, and file organization tool
 """
 import sys
 import os
+import errno
+import logging
 import re
 import shutil
+import string
+import time
 import multiprocessing
-import concurrent.futures
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import csv
+from bisect import bisect_left, bisect_right
+from collections import deque
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, List, NamedTuple, Optional, Any
 
-from PyQt6.QtWidgets import (QApplication, QMainWindow, QTableWidget,
+from PyQt6.QtWidgets import (QApplication, QMainWindow, QTableWidget, QTableView,
                              QTableWidgetItem, QVBoxLayout, QWidget, QFileDialog,
                              QPushButton, QHBoxLayout, QMessageBox, QHeaderView,
                              QLineEdit, QLabel, QComboBox, QGroupBox, QFormLayout,
@@ -27,7 +35,7 @@ from PyQt6.QtWidgets import (QApplication, QMainWindow, QTableWidget,
                              QStyle, QStyledItemDelegate,
                              QCheckBox, QProgressDialog,
                              QMenu, QScrollArea, QTabWidget)
-from PyQt6.QtCore import (Qt, QTimer, QPoint,
+from PyQt6.QtCore import (Qt, QTimer, QPoint, QAbstractTableModel, QModelIndex,
                           QThread, pyqtSignal, QFileSystemWatcher, QObject)
 from PyQt6.QtGui import (QColor, QIcon,
                          QPen, QAction, QKeySequence, QShortcut)
@@ -35,6 +43,20 @@ from PyQt6.QtGui import (QColor, QIcon,
 from mirror_panel import MirrorPanel
 import wav_metadata
 
+logger = logging.getLogger(__name__)
+
+
+class FileEntry(NamedTuple):
+    """One loaded file in AudioMetadataEditor.all_files."""
+    path: str
+    metadata: dict
+    # os.path.basename(path), computed once; shown, sorted and searched often
+    basename: str
+
+    @classmethod
+    def from_path(cls, path, metadata):
+        """Build an entry, deriving the basename from path."""
+        return cls(path, metadata, os.path.basename(path))
 
 class UndoRedoCommand:
     """Base class for undo/redo commands."""
@@ -49,51 +71,91 @@ class UndoRedoCommand:
 
 class MetadataEditCommand(UndoRedoCommand):
     """Command for editing metadata."""
+    # Edits to the same cell closer together than this (seconds) undo as one step
+    MERGE_WINDOW = 0.8
     def __init__(self, editor, file_index, field, old_value, new_value):
         super().__init__(f"Edit {field}")
         self.editor, self.file_index, self.field, self.old_value, self.new_value = (
             editor, file_index, field, old_value, new_value
         )
+        self.timestamp = time.monotonic()
+    def merge_with(self, other):
+        """Absorbs a follow-up edit of the same cell; returns True if merged."""
+        if not isinstance(other, MetadataEditCommand) or other.editor is not self.editor \
+                or (other.file_index, other.field) != (self.file_index, self.field) \
+                or other.timestamp - self.timestamp >= self.MERGE_WINDOW:
+            return False
+        self.new_value, self.timestamp = other.new_value, other.timestamp
+        return True
     def execute(self):
         """Executes the metadata edit command."""
-        _, metadata = self.editor.all_files[self.file_index]
+        metadata = self.editor.all_files[self.file_index].metadata
         metadata[self.field] = self.new_value
         self.editor.update_table_cell(self.file_index, self.field, self.new_value)
         self.editor.changes_pending = True
     def undo(self):
         """Undoes the metadata edit command."""
-        _, metadata = self.editor.all_files[self.file_index]
+        metadata = self.editor.all_files[self.file_index].metadata
         metadata[self.field] = self.old_value
         self.editor.update_table_cell(self.file_index, self.field, self.old_value)
         self.editor.changes_pending = True
 
+def rename_without_overwrite(old_path, new_path):
+    """Rename old_path to new_path, raising FileExistsError if new_path exists.
+
+    os.rename silently replaces an existing target on POSIX. A hard link
+    fails atomically with EEXIST instead, so no separate exists() check
+    (and no race window) is needed.
+    """
+    try:
+        os.link(old_path, new_path)
+    except FileExistsError:
+        # Case-only renames on case-insensitive volumes "collide" with themselves
+        if not os.path.samefile(old_path, new_path):
+            raise
+        os.rename(old_path, new_path)
+    except (AttributeError, OSError) as e:
+        # Filesystem without hard links (e.g. FAT/exFAT): fall back to a checked rename
+        if os.path.exists(new_path):
+            raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), new_path) from e
+        os.rename(old_path, new_path)
+    else:
+        os.unlink(old_path)
+
 class FileRenameCommand(UndoRedoCommand):
     """Command for renaming a file."""
     def __init__(self, editor, file_index, old_path, new_path):
-        super().__init__(f"Rename '{os.path.basename(old_path)}'")
+        self.old_filename = os.path.basename(old_path)
+        self.new_filename = os.path.basename(new_path)
+        super().__init__(f"Rename '{self.old_filename}'")
         self.editor, self.file_index, self.old_path, self.new_path = (
             editor, file_index, old_path, new_path
         )
     def execute(self):
         """Executes the file rename command."""
         try:
-            os.rename(self.old_path, self.new_path)
-            _, metadata = self.editor.all_files[self.file_index]
-            self.editor.all_files[self.file_index] = (self.new_path, metadata)
-            self.editor.update_filename_in_table(
-                self.file_index, os.path.basename(self.new_path)
+            rename_without_overwrite(self.old_path, self.new_path)
+            metadata = self.editor.all_files[self.file_index].metadata
+            self.editor.all_files[self.file_index] = FileEntry(
+                self.new_path, metadata, self.new_filename
+            )
+            self.editor.update_filename_in_table(self.file_index, self.new_filename)
+        except FileExistsError:
+            QMessageBox.critical(
+                self.editor, "Error",
+                f"Could not rename file: '{self.new_filename}' already exists."
             )
         except OSError as e:
             QMessageBox.critical(self.editor, "Error", f"Could not rename file: {e}")
     def undo(self):
         """Undoes the file rename command."""
         try:
-            os.rename(self.new_path, self.old_path)
-            _, metadata = self.editor.all_files[self.file_index]
-            self.editor.all_files[self.file_index] = (self.old_path, metadata)
-            self.editor.update_filename_in_table(
-                self.file_index, os.path.basename(self.old_path)
+            rename_without_overwrite(self.new_path, self.old_path)
+            metadata = self.editor.all_files[self.file_index].metadata
+            self.editor.all_files[self.file_index] = FileEntry(
+                self.old_path, metadata, self.old_filename
             )
+            self.editor.update_filename_in_table(self.file_index, self.old_filename)
         except OSError as e:
             QMessageBox.critical(self.editor, "Error", f"Could not undo rename: {e}")
 
@@ -104,12 +166,26 @@ class BatchCommand(UndoRedoCommand):
         self.commands = commands
     def execute(self):
         """Executes all commands in the batch."""
-        for command in self.commands:
-            command.execute()
+        self._run(command.execute for command in self.commands)
     def undo(self):
         """Undoes all commands in the batch in reverse order."""
-        for command in reversed(self.commands):
-            command.undo()
+        self._run(command.undo for command in reversed(self.commands))
+    def _run(self, actions):
+        """Run actions with table repaints suspended until the batch is done."""
+        editor = getattr(self.commands[0], "editor", None) if self.commands else None
+        table = getattr(editor, "table", None)
+        if table is None:
+            for action in actions:
+                action()
+            return
+        table.setUpdatesEnabled(False)
+        editor.begin_bulk_change()
+        try:
+            for action in actions:
+                action()
+        finally:
+            editor.end_bulk_change()
+            table.setUpdatesEnabled(True)
 
 class FileRemoveCommand(UndoRedoCommand):
     """Command for removing files."""
@@ -118,29 +194,29 @@ class FileRemoveCommand(UndoRedoCommand):
         self.editor, self.files_to_remove = editor, files_to_remove
     def execute(self):
         """Executes the file removal command."""
-        indices_to_remove = {data[0] for data in self.files_to_remove}
-        self.editor.all_files = [
-            file for i, file in enumerate(self.editor.all_files)
-            if i not in indices_to_remove
-        ]
-        self.editor.filter_table()
+        self.editor.remove_file_entries(data[0] for data in self.files_to_remove)
     def undo(self):
         """Undoes the file removal command."""
-        for index, file_path, metadata in sorted(self.files_to_remove, key=lambda x: x[0]):
-            self.editor.all_files.insert(index, (file_path, metadata))
-        self.editor.filter_table()
+        self.editor.insert_file_entries(self.files_to_remove)
 
 class UndoRedoStack:
     """Manages the undo and redo stacks."""
     def __init__(self, max_size=50):
-        self.undo_stack, self.redo_stack, self.max_size = [], [], max_size
+        # Bounded deques drop the oldest command in O(1) once max_size is reached
+        self.undo_stack, self.redo_stack = deque(maxlen=max_size), deque(maxlen=max_size)
+        self.max_size = max_size
     def push(self, command):
         """Pushes a command to the undo stack."""
+        if isinstance(command, MetadataEditCommand) and command.old_value == command.new_value:
+            return  # Nothing changed: no dirty state, no phantom undo step
         command.execute()
-        self.undo_stack.append(command)
         self.redo_stack.clear()
-        if len(self.undo_stack) > self.max_size:
-            self.undo_stack.pop(0)
+        top = self.undo_stack[-1] if self.undo_stack else None
+        if top is not None and hasattr(top, 'merge_with') and top.merge_with(command):
+            if isinstance(top, MetadataEditCommand) and top.old_value == top.new_value:
+                self.undo_stack.pop()  # The burst of edits ended where it started
+            return
+        self.undo_stack.append(command)
     def undo(self):
         """Undoes the last command."""
         if self.can_undo():
@@ -167,34 +243,165 @@ class UndoRedoStack:
 
 class MacStyleDelegate(QStyledItemDelegate):
     """Delegate for painting table items with a macOS style."""
-    # def __init__(self, parent=None): # W0246: Useless parent or super() delegation
-    #     super().__init__(parent)
+    # Theme keys painted by the delegate; their QColors are built once per palette
+    COLOR_KEYS = ('selection_bg', 'bg_tertiary', 'bg_primary', 'bg_secondary',
+                  'border_primary', 'selection_fg', 'content_primary')
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._colors_key, self._colors = None, {}
+    def _theme_colors(self, theme):
+        """Return QColors for the theme, rebuilding only when its painted colours change."""
+        # Keyed on the colour values, so an edited palette is picked up too
+        key = tuple(theme[k] for k in self.COLOR_KEYS)
+        if key != self._colors_key:
+            self._colors = {k: QColor(theme[k]) for k in self.COLOR_KEYS}
+            self._colors['border_pen'] = QPen(self._colors['border_primary'])
+            self._colors_key = key
+        return self._colors
     def paint(self, painter, option, index):
         """Paints the table item."""
         main_window = self.parent().window()
-        theme = main_window.theme
+        colors = self._theme_colors(main_window.theme)
+        selected = option.state & QStyle.StateFlag.State_Selected
         painter.save()
-        if option.state & QStyle.StateFlag.State_Selected:
-            painter.fillRect(option.rect, QColor(theme['selection_bg']))
+        if selected:
+            painter.fillRect(option.rect, colors['selection_bg'])
         elif option.state & QStyle.StateFlag.State_MouseOver:
-            painter.fillRect(option.rect, QColor(theme['bg_tertiary']))
+            painter.fillRect(option.rect, colors['bg_tertiary'])
         else:
             painter.fillRect(
                 option.rect,
-                QColor(theme['bg_primary'] if index.row() % 2 == 0 else theme['bg_secondary'])
+                colors['bg_primary'] if index.row() % 2 == 0 else colors['bg_secondary']
             )
-        painter.setPen(QPen(QColor(theme['border_primary'])))
+        painter.setPen(colors['border_pen'])
         painter.drawLine(option.rect.bottomLeft(), option.rect.bottomRight())
         text = index.model().data(index, Qt.ItemDataRole.DisplayRole)
-        painter.setPen(
-            QColor(theme['selection_fg'] if option.state & QStyle.StateFlag.State_Selected
-                   else theme['content_primary'])
-        )
+        painter.setPen(colors['selection_fg'] if selected else colors['content_primary'])
         painter.drawText(option.rect.adjusted(5, 0, -5, 0), Qt.AlignmentFlag.AlignVCenter, str(text))
         painter.restore()
 
+class MetadataTableModel(QAbstractTableModel):
+    """Table model that reads rows straight from the editor's file list.
+
+    Row ``r`` shows ``editor.all_files[editor.filtered_rows[r]]``; no per-cell
+    items are created, so filtering or sorting only needs a model reset.
+    """
+    def __init__(self, editor):
+        super().__init__(editor)
+        self.editor = editor
+    def rowCount(self, parent=QModelIndex()):
+        """Returns the number of visible (filtered) rows."""
+        return 0 if parent.isValid() else len(self.editor.filtered_rows)
+    def columnCount(self, parent=QModelIndex()):
+        """Returns the number of table columns."""
+        return 0 if parent.isValid() else len(self.editor.COLUMNS)
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Returns cell text, or the all_files index for UserRole."""
+        if not index.isValid():
+            return None
+        original_index = self.editor.filtered_rows[index.row()]
+        if role == Qt.ItemDataRole.UserRole:
+            return original_index
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            entry = self.editor.all_files[original_index]
+            field = self.editor.COLUMNS[index.column()]
+            if field == "Filename":
+                return entry.basename
+            return str(entry.metadata.get(field, ""))
+        return None
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """Returns the column titles for the horizontal header."""
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.editor.COLUMNS[section]
+        return None
+    def flags(self, index):
+        """Every column except File Path is editable."""
+        flags = super().flags(index)
+        if index.isValid() and self.editor.COLUMNS[index.column()] != "File Path":
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        """Routes an in-place edit through the editor's undoable commands."""
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        original_index = self.editor.filtered_rows[index.row()]
+        self.editor.update_metadata(original_index, self.editor.COLUMNS[index.column()], str(value))
+        return True
+    def refresh(self):
+        """Re-reads every row after filtered_rows or all_files changed shape."""
+        self.beginResetModel()
+        self.endResetModel()
+    def apply_permutation(self, order):
+        """Reorders all_files by order (new position -> old index) in place.
+
+        Visible rows, and the selection, follow their files via a layout change
+        rather than a reset, so the search is not re-run after a sort.
+        """
+        editor = self.editor
+        self.layoutAboutToBeChanged.emit()
+        old_persistent = self.persistentIndexList()
+        old_originals = [editor.filtered_rows[index.row()] for index in old_persistent]
+        new_position = [0] * len(order)
+        for new, old in enumerate(order):
+            new_position[old] = new
+        editor.all_files[:] = [editor.all_files[old] for old in order]
+        editor.filtered_rows[:] = sorted(new_position[old] for old in editor.filtered_rows)
+        if old_persistent:
+            row_of = {original: row for row, original in enumerate(editor.filtered_rows)}
+            self.changePersistentIndexList(old_persistent, [
+                self.index(row_of[new_position[original]], index.column())
+                for index, original in zip(old_persistent, old_originals)
+            ])
+        self.layoutChanged.emit()
+    def append_rows(self, original_indices):
+        """Shows extra all_files entries at the end of the visible rows."""
+        original_indices = list(original_indices)
+        if not original_indices:
+            return
+        first = len(self.editor.filtered_rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(original_indices) - 1)
+        self.editor.filtered_rows.extend(original_indices)
+        self.endInsertRows()
+    def remove_original_indices(self, removed):
+        """Removes the visible rows showing any all_files index in removed."""
+        filtered_rows = self.editor.filtered_rows
+        row = len(filtered_rows) - 1
+        # Walk bottom-up, removing each contiguous run of hits with one signal pair
+        while row >= 0:
+            if filtered_rows[row] not in removed:
+                row -= 1
+                continue
+            last = row
+            while row > 0 and filtered_rows[row - 1] in removed:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row, last)
+            del filtered_rows[row:last + 1]
+            self.endRemoveRows()
+            row -= 1
+    def insert_row(self, row, original_index):
+        """Shows all_files[original_index] at visible position row."""
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.editor.filtered_rows.insert(row, original_index)
+        self.endInsertRows()
+    def refresh_cell(self, original_index, column):
+        """Repaints one cell, if the file is currently visible."""
+        # filtered_rows is kept ascending, so the row is found by bisection
+        filtered_rows = self.editor.filtered_rows
+        row = bisect_left(filtered_rows, original_index)
+        if row == len(filtered_rows) or filtered_rows[row] != original_index:
+            return
+        index = self.index(row, column)
+        self.dataChanged.emit(index, index)
+    def refresh_all_cells(self):
+        """Repaints every cell in one dataChanged, e.g. after a batch of edits."""
+        rows = self.rowCount()
+        if rows:
+            self.dataChanged.emit(self.index(0, 0), self.index(rows - 1, self.columnCount() - 1))
+
 class AnimatedPushButton(QPushButton):
     """A QPushButton with animations and theme support."""
+    # (button class, sorted palette items) -> stylesheet; shared by all buttons
+    _style_cache = {}
     def __init__(self, text="", parent=None):
         super().__init__(text, parent)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -207,8 +414,23 @@ class AnimatedPushButton(QPushButton):
             widget = widget.parent()
         return AudioMetadataEditor.THEMES['dark']  # Fallback to dark theme
     def update_button_style(self): # TODO: Add docstring
-        theme = self.get_theme()
-        self.setStyleSheet(f"""
+        style = self.style_for_theme(self.get_theme())
+        # Re-setting an identical stylesheet still makes Qt re-parse and re-polish
+        if style != self.styleSheet():
+            self.setStyleSheet(style)
+    @classmethod
+    def style_for_theme(cls, theme):
+        """Return this button class's stylesheet for theme, building it once per palette."""
+        # Keyed on palette content, like _render_stylesheet, so edits are re-rendered
+        key = (cls, tuple(sorted(theme.items())))
+        style = cls._style_cache.get(key)
+        if style is None:
+            style = cls._style_cache[key] = cls.build_style(theme)
+        return style
+    @staticmethod
+    def build_style(theme):
+        """Builds the button stylesheet for a theme palette."""
+        return f"""
             QPushButton {{
                 background-color: {theme['button_secondary_bg']};
                 color: {theme['button_secondary_fg']};
@@ -223,13 +445,14 @@ class AnimatedPushButton(QPushButton):
             QPushButton:pressed {{
                 background-color: {theme['button_secondary_pressed_bg']};
             }}
-        """)
+        """
 
 class AnimatedPrimaryButton(AnimatedPushButton):
     """A primary animated button with different styling."""
-    def update_button_style(self): # TODO: Add docstring
-        theme = self.get_theme()
-        self.setStyleSheet(f"""
+    @staticmethod
+    def build_style(theme):
+        """Builds the primary button stylesheet for a theme palette."""
+        return f"""
             QPushButton {{
                 background-color: {theme['button_primary_bg']};
                 color: {theme['button_primary_fg']};
@@ -244,7 +467,7 @@ class AnimatedPrimaryButton(AnimatedPushButton):
             QPushButton:pressed {{
                 background-color: {theme['button_primary_pressed_bg']};
             }}
-        """)
+        """
 
 class SettingsDialog(QDialog):
     """Comprehensive settings dialog with multiple sections."""
@@ -675,55 +898,154 @@ metadata of WAV audio files with advanced background processing capabilities.</p
         }}
         """)
 
+def _log_unlistable_folder(error):
+    """onerror hook for wav_metadata.iter_wav_files: note folders that cannot be listed."""
+    logger.warning("Could not list %s: %s", error.filename, error)
+
+def safe_read_metadata(file_path):
+    """Safely reads WAV metadata from a file.
+
+    Module-level so it can be pickled into FileLoadWorker's process pool.
+    """
+    try:
+        return wav_metadata.read_wav_metadata(file_path)
+    except IOError as e: # More specific exception
+        logger.warning("Could not read WAV metadata from %s: %s", file_path, e)
+        return None
+    except ValueError as e: # More specific exception for parsing issues
+        logger.warning("Could not parse WAV metadata from %s: %s", file_path, e)
+        return None
+    except Exception as e: # Catch all for other errors
+        logger.warning("Unexpected error reading WAV metadata from %s: %s", file_path, e)
+        return None
+
+def build_search_index(entry):
+    """Return (casefolded "All" haystack, {field: casefolded value}) for a FileEntry."""
+    folded = {k: str(v).casefold() for k, v in entry.metadata.items()}
+    # \x1f can't be typed into the search box, so matches never span fields
+    haystack = "\x1f".join((entry.basename.casefold(), *folded.values()))
+    return haystack, folded
+
 class FileLoadWorker(QThread):
-    """Worker thread for loading files."""
-    progress = pyqtSignal(int, int, str)
+    """Worker thread for loading files.
+
+    Progress is not signalled per file: the worker only updates done_count
+    and last_name, which the GUI polls on a timer.
+    """
+    # (FileEntry objects, {path: build_search_index(entry)}) for the same files
+    batch_ready = pyqtSignal(list, dict)
     finished = pyqtSignal(list)
-    def __init__(self, file_paths):
+    # Paths handed to each worker process per round trip
+    CHUNK_SIZE = 8
+    # Loaded FileEntry objects handed to the GUI per batch_ready signal
+    BATCH_SIZE = 50
+    def __init__(self, file_paths, executor):
         super().__init__()
-        self.file_paths = file_paths
+        # executor is the editor's long-lived parser pool; it is not shut down here
+        self.file_paths, self.executor = file_paths, executor
+        # Plain attribute writes are atomic under the GIL; read by the GUI thread
+        self.done_count, self.last_name = 0, ""
+        self.pool_broken = False
     def run(self):
-        """Runs the file loading process."""
-        results = []
-        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
-            future_to_path = {
-                executor.submit(self.safe_read_metadata, path): path for path in self.file_paths
-            }
-
-            for i, future in enumerate(concurrent.futures.as_completed(future_to_path)):
-                path = future_to_path[future]
+        """Runs the file loading process.
+
+        Header parsing is CPU-bound Python, so it is spread over worker
+        processes rather than threads that would contend for the GIL.
+        """
+        results, batch, search_batch = [], [], {}
+        try:
+            metadata_iter = self.executor.map(
+                safe_read_metadata, self.file_paths, chunksize=self.CHUNK_SIZE
+            )
+            for i, (path, metadata) in enumerate(zip(self.file_paths, metadata_iter)):
                 if self.isInterruptionRequested():
-                    executor.shutdown(wait=False, cancel_futures=True)
+                    metadata_iter.close()  # Cancels the chunks not yet started
                     return
-
-                try:
-                    metadata = future.result()
-                    if metadata:
-                        results.append((path, metadata))
-                except IOError as e: # More specific exception
-                    print(f"I/O error processing file {path}: {e}")
-                except ValueError as e: # More specific exception for parsing issues
-                    print(f"Error parsing metadata for file {path}: {e}")
-                except Exception as e: # Catch all for other errors
-                    print(f"Unexpected error processing file {path}: {e}")
-
-                self.progress.emit(i + 1, len(self.file_paths), os.path.basename(path))
-
+                if metadata:
+                    entry = FileEntry.from_path(path, metadata)
+                    results.append(entry)
+                    batch.append(entry)
+                    # Casefold here while the pool parses, not on the first keystroke
+                    search_batch[path] = build_search_index(entry)
+                    if len(batch) >= self.BATCH_SIZE:
+                        self.batch_ready.emit(batch, search_batch)
+                        batch, search_batch = [], {}
+                self.last_name = path
+                self.done_count = i + 1
+        except BrokenProcessPool as e:
+            logger.error("File loading worker process died: %s", e)
+            self.pool_broken = True
+
+        if batch:
+            self.batch_ready.emit(batch, search_batch)
         self.finished.emit(results)
 
-    def safe_read_metadata(self, file_path):
-        """Safely reads WAV metadata from a file."""
-        try:
-            return wav_metadata.read_wav_metadata(file_path)
-        except IOError as e: # More specific exception
-            print(f"Could not read WAV metadata from {file_path}: {e}")
-            return None
-        except ValueError as e: # More specific exception for parsing issues
-            print(f"Could not parse WAV metadata from {file_path}: {e}")
-            return None
-        except Exception as e: # Catch all for other errors
-            print(f"Unexpected error reading WAV metadata from {file_path}: {e}")
-            return None
+class SortWorker(QThread):
+    """Worker thread that sorts a snapshot of all_files for large tables."""
+    # (sorted order, newly computed keys); QThread.finished follows once run() returns
+    sorted_ready = pyqtSignal(list, dict)
+    def __init__(self, entries, col, descending, key_cache, key_funcs):
+        super().__init__()
+        self.entries, self.col, self.descending = entries, col, descending
+        self.key_cache, self.key_funcs = key_cache, key_funcs
+    def run(self):
+        """Runs the sort and emits (sorted order, newly computed keys)."""
+        self.sorted_ready.emit(*sorted_order(
+            self.entries, self.col, self.descending, self.key_cache, self.key_funcs
+        ))
+
+def _filename_sort_key(item):
+    """Sort key for the Filename column of an all_files entry."""
+    return item.basename.casefold()
+
+def _take_sort_key(item):
+    """Sort key for the Take column: numeric takes first, compared as numbers.
+
+    Keys are (0, int) or (1, casefolded text) so mixed columns never compare
+    an int with a str.
+    """
+    val = str(item.metadata.get("Take", ""))
+    return (0, int(val)) if val.isdigit() else (1, val.casefold())
+
+def _field_sort_key(field):
+    """Build a case-insensitive (casefolded) sort key for a plain metadata column."""
+    return lambda item: str(item.metadata.get(field, "")).casefold()
+
+def sorted_order(entries, col, descending, key_cache, key_funcs):
+    """Return the order that sorts FileEntry objects by column col.
+
+    The order lists indices into entries, new position first. key_cache maps
+    file path -> tuple of per-column keys and is only read; keys missing from
+    it are computed with key_funcs and returned alongside the order so the
+    caller can merge them on the GUI thread.
+    """
+    new_keys, decorated = {}, []
+    for i, entry in enumerate(entries):
+        keys = key_cache.get(entry.path)
+        if keys is None:
+            keys = new_keys[entry.path] = tuple(key(entry) for key in key_funcs)
+        decorated.append((keys[col], i))
+    # Decorate-sort-undecorate: compare precomputed keys through a C-level getter
+    decorated.sort(key=itemgetter(0), reverse=descending)
+    return [i for _, i in decorated], new_keys
+
+# Directory holding the QSS templates shipped next to this module
+RESOURCES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources")
+
+@lru_cache(maxsize=None)
+def _stylesheet_template(name):
+    """Read a QSS template from RESOURCES_DIR once; its $name slots are THEMES keys."""
+    with open(os.path.join(RESOURCES_DIR, name), encoding="utf-8") as f:
+        return string.Template(f.read())
+
+@lru_cache(maxsize=8)
+def _render_stylesheet(name, palette_items):
+    """Fill QSS template name from palette_items, a sorted tuple of (key, colour) pairs.
+
+    Keyed by palette content rather than theme name, so an edited palette is
+    re-rendered while switching among a few palettes never reparses the template.
+    """
+    return _stylesheet_template(name).substitute(dict(palette_items))
 
 class AudioMetadataEditor(QMainWindow):
     """Main window for the Audio Metadata Editor application."""
@@ -751,6 +1073,25 @@ class AudioMetadataEditor(QMainWindow):
             "button_secondary_pressed_bg": "#B0B3B8"
         }
     }
+    # Table columns; the header text doubles as the metadata key for each column
+    COLUMNS = (
+        "Filename", "Show", "Scene", "Take", "Category", "Subcategory",
+        "Slate", "iXML Note", "iXML Wildtrack", "iXML Circled", "File Path"
+    )
+    COLUMN_INDEX = {name: i for i, name in enumerate(COLUMNS)}
+    # Tables at least this long are sorted on a SortWorker thread
+    BACKGROUND_SORT_MIN_ROWS = 5000
+    # Shorter "All" searches match nearly every row, so they show everything unfiltered
+    MIN_SEARCH_LENGTH = 2
+    # Typing debounce in ms for (small, large) tables; large is as for background sorts
+    SEARCH_DEBOUNCE_MS = (150, 500)
+    # Sort key per column, indexed like COLUMNS
+    SORT_KEYS = tuple(
+        _filename_sort_key if name == "Filename" else
+        _take_sort_key if name == "Take" else
+        _field_sort_key(name)
+        for name in COLUMNS
+    )
 
     def __init__(self):
         super().__init__()
@@ -763,6 +1104,24 @@ class AudioMetadataEditor(QMainWindow):
         self.undo_redo_stack = UndoRedoStack()
         self.current_sort_column_index, self.current_sort_order = 0, Qt.SortOrder.AscendingOrder
         self.all_files, self.filtered_rows, self.changes_pending = [], [], False
+        # file path -> tuple of SORT_KEYS values; dropped when that file's row changes
+        self._sort_cache = {}
+        # file path -> (casefolded "All" haystack, {field: casefolded value}) for searches
+        self._search_cache = {}
+        # search field -> that text for every all_files row, in row order; filter_table
+        # scans these lists directly. Valid while _search_columns_version matches.
+        self._search_columns, self._search_columns_version = {}, None
+        # (field, needle, _mutation_counter, row count) that produced filtered_rows, if any
+        self._last_filter = None
+        # Render every theme up front so a toggle is only a cache hit
+        for name in self.THEMES:
+            self._build_stylesheet(name)
+        self._applied_stylesheet = None  # Cached string last handed to setStyleSheet
+        # Bumped on every change to all_files; lets apply_current_sort skip no-op sorts
+        self._mutation_counter, self._last_sorted_signature = 0, None
+        self._pending_sort_signature = None
+        # While a batch runs, cell refreshes only record that a repaint is due
+        self._bulk, self._bulk_repaint = False, False
 
         self._init_ui_elements() # Initialize UI elements before _init_ui
         self._init_ui()
@@ -770,6 +1129,20 @@ class AudioMetadataEditor(QMainWindow):
         self.search_timer = QTimer(self)
         self.search_timer.setSingleShot(True)
         self.search_timer.timeout.connect(self.filter_table)
+        # Coalesces bursts of header clicks into one sort, like search_timer does for typing
+        self.sort_timer = QTimer(self)
+        self.sort_timer.setSingleShot(True)
+        self.sort_timer.setInterval(80)
+        self.sort_timer.timeout.connect(self.apply_current_sort)
+        # Polls FileLoadWorker's counter while a load runs (~20 updates/s)
+        self.load_progress_timer = QTimer(self)
+        self.load_progress_timer.setInterval(50)
+        self.load_progress_timer.timeout.connect(self.poll_file_load_progress)
+        # Theme changes made in one event-loop pass restyle the window only once
+        self.stylesheet_timer = QTimer(self)
+        self.stylesheet_timer.setSingleShot(True)
+        self.stylesheet_timer.setInterval(0)
+        self.stylesheet_timer.timeout.connect(self.apply_stylesheet)
         QTimer.singleShot(0, self.finish_setup)
 
     def _init_ui_elements(self):
@@ -781,6 +1154,7 @@ class AudioMetadataEditor(QMainWindow):
         self.search_container = None
         self.search_input = None
         self.search_field_btn = None
+        self.search_field = "All"
         self.mirror_btn = None
         self.extract_btn = None
         self.settings_btn = None
@@ -788,8 +1162,12 @@ class AudioMetadataEditor(QMainWindow):
         self.mirror_panel = None
         self.status_label = None
         self.table = None
+        self.table_model = None
         self.progress = None
         self.file_load_worker = None
+        # Parser processes shared by every load; see metadata_pool()
+        self._metadata_pool = None
+        self.sort_worker = None
         self.agent_manager = None
 
 
@@ -969,20 +1347,20 @@ class AudioMetadataEditor(QMainWindow):
         cl.addWidget(status_container)
         l.addWidget(cw)
     def _create_table(self, l): # TODO: Add docstring
-        self.table = QTableWidget(0, 11, self)
+        self.table = QTableView(self)
         self.table.setObjectName("metadata_table")
-        self.table.setHorizontalHeaderLabels([
-            "Filename", "Show", "Scene", "Take", "Category", "Subcategory",
-            "Slate", "iXML Note", "iXML Wildtrack", "iXML Circled", "File Path"
-        ])
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.DoubleClicked)
+        self.table_model = MetadataTableModel(self)
+        self.table.setModel(self.table_model)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.table.setEditTriggers(QTableView.EditTrigger.DoubleClicked)
         self.table.verticalHeader().setVisible(False)
-        self.table.setSortingEnabled(True)
-        self.table.horizontalHeader().sectionClicked.connect(self.sort_table_by_column)
+        # Sorting is done on all_files by sort_table_by_column; the view only shows the indicator
         h = self.table.horizontalHeader()
+        h.setSortIndicatorShown(True)
+        h.setSectionsClickable(True)
+        h.sectionClicked.connect(self.sort_table_by_column)
         h.setMinimumSectionSize(100)
-        for c in range(self.table.columnCount()):
+        for c in range(len(self.COLUMNS)):
             h.setSectionResizeMode(c, QHeaderView.ResizeMode.Interactive)
         # Set optimized column widths for better header visibility
         self.table.setColumnWidth(0, 180)  # Filename
@@ -997,258 +1375,29 @@ class AudioMetadataEditor(QMainWindow):
         self.table.setColumnWidth(9, 110)  # iXML Circled
         self.table.setColumnWidth(10, 200) # File Path
         self.table.setItemDelegate(MacStyleDelegate(self))
-        self.table.itemChanged.connect(self.update_metadata)
-        self.table.itemSelectionChanged.connect(self.on_selection_changed)
+        self.table.selectionModel().selectionChanged.connect(self.on_selection_changed)
         self.setup_table_context_menu()
         l.addWidget(self.table)
-    def on_search_text_changed(self): # TODO: Add docstring
-        self.search_timer.start(300)
-    def apply_stylesheet(self): # TODO: Add docstring
-        theme = self.theme
-        self.setStyleSheet(f"""
-        /* Main Window */
-        #central_widget {{
-            background-color: {theme['bg_primary']};
-            border: none;
-            border-radius: 0px;
-        }}
-
-        /* Toolbar */
-        #integrated_toolbar {{
-            background-color: {theme['bg_secondary']};
-            border: none;
-            border-bottom: 1px solid {theme['border_primary']};
-            margin: 0;
-        }}
-
-        #app_title {{
-            color: {theme['content_primary']};
-            font-size: 14px;
-            font-weight: bold;
-        }}
-
-        /* Window Controls */
-        #minimize_button, #maximize_button, #close_button {{
-            background-color: transparent;
-            color: {theme['content_secondary']};
-            border: none;
-            font-size: 14px;
-            font-weight: bold;
-            border-radius: 6px;
-            margin: 1px;
-        }}
-
-        #close_button:hover {{
-            background-color: {theme['accent_danger']};
-            color: white;
-        }}
-
-        #minimize_button:hover, #maximize_button:hover {{
-            background-color: {theme['bg_tertiary']};
-        }}
-
-        /* Table Styling */
-        #metadata_table {{
-            background-color: {theme['bg_primary']};
-            color: {theme['content_primary']};
-            border: 1px solid {theme['border_primary']};
-            border-radius: 8px;
-            gridline-color: {theme['border_primary']};
-            font-size: 13px;
-            selection-background-color: {theme['selection_bg']};
-            selection-color: {theme['selection_fg']};
-        }}
-
-        QHeaderView::section {{
-            background-color: {theme['bg_secondary']};
-            color: {theme['content_secondary']};
-            padding: 4px 8px;
-            border: none;
-            border-bottom: 2px solid {theme['border_primary']};
-            border-right: 1px solid {theme['border_primary']};
-            font-weight: bold;
-            font-size: 10px;
-            text-transform: none;
-            letter-spacing: 0px;
-        }}
-
-        QHeaderView::section:hover {{
-            background-color: {theme['bg_tertiary']};
-            color: {theme['content_primary']};
-        }}
-
-        QHeaderView::section:first {{
-            border-top-left-radius: 6px;
-        }}
-
-        QHeaderView::section:last {{
-            border-top-right-radius: 6px;
-            border-right: none;
-        }}
-
-        /* Input Fields */
-        QLineEdit {{
-            background-color: {theme['bg_secondary']};
-            color: {theme['content_primary']};
-            border: 2px solid {theme['border_primary']};
-            border-radius: 6px;
-            padding: 8px 12px;
-            font-size: 13px;
-        }}
-
-        QLineEdit:hover {{
-            border-color: {theme['bg_tertiary']};
-        }}
-
-        /* Search Container with Embedded Dropdown */
-        #search_container {{
-            background-color: {theme['bg_secondary']};
-            border: 2px solid {theme['border_primary']};
-            border-radius: 6px;
-            padding: 0px;
-        }}
-
-        #search_container:hover {{
-            border-color: {theme['bg_tertiary']};
-        }}
-
-        #search_input_embedded {{
-            background-color: transparent;
-            border: none;
-            border-radius: 0px;
-            padding: 8px 12px;
-            font-size: 13px;
-        }}
-
-        #search_input_embedded:focus {{
-            background-color: transparent;
-            border: none;
-            outline: none;
-        }}
-
-        #search_dropdown_btn {{
-            background-color: {theme['bg_tertiary']};
-            color: {theme['content_secondary']};
-            border: none;
-            border-left: 1px solid {theme['border_primary']};
-            border-radius: 0px;
-            border-top-right-radius: 4px;
-            border-bottom-right-radius: 4px;
-            padding: 8px 6px;
-            font-size: 11px;
-            font-weight: 500;
-            min-width: 50px;
-        }}
-
-        #search_dropdown_btn:hover {{
-            background-color: {theme['accent_primary']};
-            color: white;
-        }}
-
-        #search_dropdown_btn:pressed {{
-            background-color: {theme['button_secondary_pressed_bg']};
-        }}
-
-        /* Buttons */
-        QPushButton {{
-            font-size: 13px;
-            font-weight: 500;
-            border-radius: 6px;
-            padding: 8px 16px;
-        }}
-
-        /* Dropdown/ComboBox */
-        QComboBox {{
-            background-color: {theme['bg_secondary']};
-            color: {theme['content_primary']};
-            border: 2px solid {theme['border_primary']};
-            border-radius: 6px;
-            padding: 6px 12px;
-            font-size: 13px;
-        }}
-
-        QComboBox:hover {{
-            border-color: {theme['bg_tertiary']};
-        }}
-
-        QComboBox::drop-down {{
-            border: none;
-            background-color: transparent;
-        }}
-
-        /* Splitter */
-        QSplitter::handle {{
-            background-color: {theme['border_primary']};
-            border-radius: 2px;
-        }}
-
-        QSplitter::handle:hover {{
-            background-color: {theme['accent_primary']};
-        }}
-
-        /* Toolbar Separators */
-        QFrame[frameShape="5"] {{
-            color: {theme['border_primary']};
-            background-color: {theme['border_primary']};
-            margin: 4px 8px;
-        }}
-
-        /* Status Label */
-        #status_container {{
-            background-color: {theme['bg_secondary']};
-            border-top: 1px solid {theme['border_primary']};
-            border-bottom-left-radius: 8px;
-            border-bottom-right-radius: 8px;
-        }}
-
-        #status_label {{
-            color: {theme['content_secondary']};
-            font-size: 11px;
-            padding: 0px;
-            background-color: transparent;
-            border: none;
-        }}
-
-        /* Menus */
-        QMenu {{
-            background-color: {theme['bg_secondary']};
-            color: {theme['content_primary']};
-            border: 1px solid {theme['border_primary']};
-            border-radius: 8px;
-            padding: 6px;
-        }}
-
-        QMenu::item {{
-            padding: 8px 20px;
-            border-radius: 4px;
-        }}
-
-        QMenu::item:selected {{
-            background-color: {theme['accent_primary']};
-            color: white;
-        }}
-
-        /* Progress Dialog */
-        QProgressDialog {{
-            background-color: {theme['bg_primary']};
-            color: {theme['content_primary']};
-            border: 1px solid {theme['border_primary']};
-            border-radius: 8px;
-        }}
-
-        QProgressBar {{
-            background-color: {theme['bg_secondary']};
-            border: 1px solid {theme['border_primary']};
-            border-radius: 4px;
-            text-align: center;
-            color: {theme['content_primary']};
-        }}
-
-        QProgressBar::chunk {{
-            background-color: {theme['accent_primary']};
-            border-radius: 3px;
-        }}
-        """)
+    def on_search_text_changed(self):
+        """Debounce filtering; queries too short to filter show all rows at once."""
+        if self._row_filter() is None:
+            self.search_timer.stop()
+            if len(self.filtered_rows) != len(self.all_files):
+                self.filter_table()
+            return
+        large = len(self.all_files) >= self.BACKGROUND_SORT_MIN_ROWS
+        self.search_timer.start(self.SEARCH_DEBOUNCE_MS[large])
+    @classmethod
+    def _build_stylesheet(cls, theme_name):
+        """Return the main window stylesheet for the THEMES entry theme_name."""
+        return _render_stylesheet("app.qss", tuple(sorted(cls.THEMES[theme_name].items())))
+    def apply_stylesheet(self):
+        """Apply the cached stylesheet for the current theme, unless it already is."""
+        style = self._build_stylesheet(self.current_theme)
+        if style is self._applied_stylesheet:
+            return  # Same cached object: Qt would only reparse identical QSS
+        self._applied_stylesheet = style
+        self.setStyleSheet(style)
         self.update_animated_button_styles()
     def toggle_maximized(self):
         """Toggles the maximized state of the window."""
@@ -1268,10 +1417,6 @@ class AudioMetadataEditor(QMainWindow):
         QShortcut(QKeySequence("Cmd+,"), self, self.show_settings_dialog)
     def focus_search(self): # TODO: Add docstring
         self.search_input.setFocus()
-    def _get_sort_key(self, item, col): # TODO: Add docstring
-        header = self.table.horizontalHeaderItem(col).text()
-        val = item[1].get(header, "") if header != "Filename" else os.path.basename(item[0])
-        return int(val) if header == 'Take' and val.isdigit() else str(val).lower()
     def sort_table_by_column(self, col): # TODO: Add docstring
         if self.current_sort_column_index == col and \
            self.current_sort_order == Qt.SortOrder.AscendingOrder:
@@ -1279,12 +1424,70 @@ class AudioMetadataEditor(QMainWindow):
         else:
             self.current_sort_order = Qt.SortOrder.AscendingOrder
         self.current_sort_column_index = col
+        # Show the new indicator now; the sort itself waits for clicks to settle
+        self.table.horizontalHeader().setSortIndicator(col, self.current_sort_order)
+        self.sort_timer.start()
+    def apply_current_sort(self):
+        """Sort all_files by the current column and order, then refilter."""
+        col = self.current_sort_column_index
         self.table.horizontalHeader().setSortIndicator(col, self.current_sort_order)
-        self.all_files.sort(
-            key=lambda item: self._get_sort_key(item, col),
-            reverse=self.current_sort_order == Qt.SortOrder.DescendingOrder
+        signature = self._sort_signature()
+        if signature in (self._last_sorted_signature, self._pending_sort_signature):
+            return  # Already in (or being put in) this order with nothing changed
+        last = self._last_sorted_signature
+        if last is not None and self._pending_sort_signature is None and \
+           (last[0], last[2:]) == (col, signature[2:]):
+            # Only the direction flipped: the rows are sorted the other way already
+            self._apply_sorted(signature, list(range(len(self.all_files) - 1, -1, -1)), {})
+            return
+        descending = self.current_sort_order == Qt.SortOrder.DescendingOrder
+        if len(self.all_files) >= self.BACKGROUND_SORT_MIN_ROWS:
+            if self.sort_worker is not None and self.sort_worker.isRunning():
+                return  # on_sort_worker_done picks this request up once the worker exits
+            # Sort a snapshot off the GUI thread; on_sort_finished drops stale results
+            self._pending_sort_signature = signature
+            worker = SortWorker(
+                list(self.all_files), col, descending, dict(self._sort_cache), self.SORT_KEYS
+            )
+            worker.sorted_ready.connect(
+                lambda order, new_keys: self.on_sort_finished(signature, order, new_keys)
+            )
+            worker.finished.connect(lambda: self.on_sort_worker_done(worker))
+            self.sort_worker = worker
+            self.status_label.setText("Sorting…")
+            worker.start()
+            return
+        order, new_keys = sorted_order(
+            self.all_files, col, descending, self._sort_cache, self.SORT_KEYS
         )
-        self.filter_table()
+        self._apply_sorted(signature, order, new_keys)
+    def _sort_signature(self):
+        """Identify the current sort request together with the state of all_files."""
+        return (self.current_sort_column_index, self.current_sort_order,
+                len(self.all_files), self._mutation_counter)
+    def on_sort_finished(self, signature, order, new_keys):
+        """Apply a background sort if all_files did not change while it ran."""
+        if signature == self._pending_sort_signature:
+            self._pending_sort_signature = None
+        if signature != self._sort_signature():
+            return  # Data or order changed meanwhile; on_sort_worker_done sorts again
+        self.status_label.setText("Ready")
+        self._apply_sorted(signature, order, new_keys)
+    def on_sort_worker_done(self, worker):
+        """Run any sort requested while worker was busy, once its thread has exited."""
+        worker.wait()  # finished is emitted just before the thread stops running
+        if self._sort_signature() != self._last_sorted_signature:
+            self.apply_current_sort()
+    def _apply_sorted(self, signature, order, new_keys):
+        """Install a sorted order computed for signature."""
+        self._sort_cache.update(new_keys)
+        self._search_columns.clear()  # Laid out in the old row order
+        # Sorting never changes which files match the search, only where they sit
+        self.table_model.apply_permutation(order)
+        self._last_sorted_signature = signature
+        if self.table.selectionModel().hasSelection():
+            # The selection followed its files, but their all_files indices changed
+            self.on_selection_changed()
     def on_selection_changed(self): # TODO: Add docstring
         selected_count = len(self.table.selectionModel().selectedRows())
         self.status_label.setText(f"{selected_count} items selected")
@@ -1300,11 +1503,9 @@ class AudioMetadataEditor(QMainWindow):
     def browse_folder(self): # TODO: Add docstring
         path = QFileDialog.getExistingDirectory(self, "Select Directory")
         if path:
-            wav_files = [
-                os.path.join(r, f) for r, _, fs in os.walk(path)
-                for f in fs if f.lower().endswith('.wav')
-            ]
-            self.load_files_from_paths(wav_files)
+            self.load_files_from_paths(list(
+                wav_metadata.iter_wav_files(path, onerror=_log_unlistable_folder)
+            ))
     def load_files_from_paths(self, paths): # TODO: Add docstring
         if not paths:
             return
@@ -1312,66 +1513,180 @@ class AudioMetadataEditor(QMainWindow):
         self.progress.setWindowModality(Qt.WindowModality.WindowModal)
         self.all_files.clear()
         self.filtered_rows.clear()
-        self.file_load_worker = FileLoadWorker(paths)
+        self._sort_cache.clear()
+        self._search_cache.clear()
+        self._mutation_counter += 1
+        self.update_table()
+        self.file_load_worker = FileLoadWorker(paths, self.metadata_pool())
+        self.file_load_worker.batch_ready.connect(self.on_file_batch_loaded)
         self.file_load_worker.finished.connect(self.on_file_loaded)
-        self.file_load_worker.progress.connect(self.on_file_load_progress)
+        self.load_progress_timer.start()
         self.file_load_worker.start()
-    def on_file_loaded(self, results): # TODO: Add docstring
-        self.all_files.extend(results)
-        self.filter_table()
+    def metadata_pool(self):
+        """Return the process pool that parses WAV headers, starting it on first use.
+
+        Workers are spawned rather than forked on every platform: fork() from
+        a QThread of this multi-threaded Qt process can deadlock the child.
+        A spawned worker re-imports this module, so one pool serves the whole
+        session and that start-up cost is paid once instead of per load.
+        """
+        if self._metadata_pool is None:
+            self._metadata_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._metadata_pool
+    def shutdown_metadata_pool(self):
+        """Stop the parser processes; the next load starts a fresh pool."""
+        if self._metadata_pool is not None:
+            self._metadata_pool.shutdown(wait=False, cancel_futures=True)
+            self._metadata_pool = None
+    def poll_file_load_progress(self):
+        """Copy the worker's progress counter into the progress dialog."""
+        worker = self.file_load_worker
+        if worker is not None and worker.done_count:
+            self.on_file_load_progress(
+                worker.done_count, len(worker.file_paths), os.path.basename(worker.last_name)
+            )
+    def on_file_batch_loaded(self, batch, search_index):
+        """Append a batch of loaded files and show them without a full reset."""
+        start = len(self.all_files)
+        self.all_files.extend(batch)
+        self._search_cache.update(search_index)
+        self._mutation_counter += 1
+        if self.search_input.text():
+            self.filter_table()
+        else:
+            self.table_model.append_rows(range(start, len(self.all_files)))
+    def on_file_loaded(self, _results):
+        """Finish a load; _results is ignored since rows already arrived via batch_ready."""
+        self.load_progress_timer.stop()
+        if self.file_load_worker.pool_broken:
+            self.shutdown_metadata_pool()  # A broken pool rejects all further work
+        if self.progress: # Also covers loads where every file failed
+            self.progress.close()
+        # Keep the user's current sort; sort_table_by_column would flip its direction
+        self.apply_current_sort()
     def on_file_load_progress(self, c, t, f): # TODO: Add docstring
         if c == t:
             if self.progress: # Check if progress dialog still exists
                 self.progress.close()
-            self.sort_table_by_column(self.current_sort_column_index)
         else:
             if self.progress: # Check if progress dialog still exists
                 self.progress.setValue(c)
                 self.progress.setLabelText(f"Loading: {f}")
     def update_table(self): # TODO: Add docstring
-        self.table.setSortingEnabled(False)
-        self.table.setRowCount(0)
-        self.table.setRowCount(len(self.filtered_rows))
-        headers = [self.table.horizontalHeaderItem(i).text() for i in range(self.table.columnCount())]
-        for row_idx, original_index in enumerate(self.filtered_rows):
-            file_path, metadata = self.all_files[original_index]
-            for col_idx, field in enumerate(headers):
-                val = os.path.basename(file_path) if field == "Filename" \
-                    else str(metadata.get(field, ""))
-                item = QTableWidgetItem(val)
-                item.setData(Qt.ItemDataRole.UserRole, original_index)
-                if field == "File Path":
-                    item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.table.setItem(row_idx, col_idx, item)
-        self.table.setSortingEnabled(True)
+        had_selection = self.table.selectionModel().hasSelection()
+        self.table_model.refresh()
+        if had_selection:
+            self.on_selection_changed()
+    def begin_bulk_change(self):
+        """Defer cell repaints until end_bulk_change()."""
+        self._bulk, self._bulk_repaint = True, False
+    def end_bulk_change(self):
+        """Leave bulk mode and repaint once if any cell changed."""
+        self._bulk = False
+        if self._bulk_repaint:
+            self._bulk_repaint = False
+            self.table_model.refresh_all_cells()
+    def _refresh_cell(self, idx, column):
+        """Repaint one table cell now, or all of them once the current batch ends."""
+        if self._bulk:
+            self._bulk_repaint = True
+        else:
+            self.table_model.refresh_cell(idx, column)
+    def _search_index(self, entry):
+        """Return the cached (haystack, folded values) search data for entry."""
+        index = self._search_cache.get(entry.path)
+        if index is None:
+            index = self._search_cache[entry.path] = build_search_index(entry)
+        return index
+    def _search_column(self, field):
+        """Return the casefolded search text of field for every all_files row, in order."""
+        version = (self._mutation_counter, len(self.all_files))
+        if version != self._search_columns_version:
+            self._search_columns, self._search_columns_version = {}, version
+        column = self._search_columns.get(field)
+        if column is None:
+            search_index = self._search_index
+            if field == "All":
+                column = [search_index(entry)[0] for entry in self.all_files]
+            else:
+                column = [search_index(entry)[1].get(field, "") for entry in self.all_files]
+            self._search_columns[field] = column
+        return column
+    def _forget_row_keys(self, path):
+        """Drop the cached sort and search keys of a file whose row changed."""
+        self._sort_cache.pop(path, None)
+        self._search_cache.pop(path, None)
+    def _row_filter(self):
+        """Return a FileEntry predicate for the search, or None if it is empty."""
+        needle = self.search_input.text().casefold()
+        search_index, search_field = self._search_index, self.search_field
+        if not needle or (search_field == "All" and len(needle) < self.MIN_SEARCH_LENGTH):
+            return None
+        if search_field == "All":
+            return lambda entry: needle in search_index(entry)[0]
+        return lambda entry: needle in search_index(entry)[1].get(search_field, "")
     def filter_table(self): # TODO: Add docstring
-        search_text = self.search_input.text().lower()
-        search_field = self.search_field_btn.text().replace(" ▼", "")
-        self.filtered_rows = []
-        for i, (fp, meta) in enumerate(self.all_files):
-            if not search_text:
-                self.filtered_rows.append(i)
-                continue
-            if search_field == "All" and \
-               (search_text in os.path.basename(fp).lower() or
-                    any(search_text in str(v).lower() for v in meta.values())):
-                self.filtered_rows.append(i)
-            elif search_field != "All" and search_text in str(meta.get(search_field, "")).lower():
-                self.filtered_rows.append(i)
+        if self._row_filter() is None:
+            self.filtered_rows = list(range(len(self.all_files)))
+            self._last_filter = None
+        else:
+            # Bare substring tests over a flat list; no predicate call per row
+            needle, field = self.search_input.text().casefold(), self.search_field
+            column = self._search_column(field)
+            state = (self._mutation_counter, len(self.all_files))
+            last = self._last_filter
+            if last is not None and last[0] == field and needle.startswith(last[1]) \
+                    and last[2:] == state:
+                # Typing more can only drop rows, and no row changed since the last filter
+                self.filtered_rows = [i for i in self.filtered_rows if needle in column[i]]
+            else:
+                self.filtered_rows = [i for i, text in enumerate(column) if needle in text]
+            self._last_filter = (field, needle) + state
         self.update_table()
-    def update_metadata(self, item): # TODO: Add docstring
-        original_index = item.data(Qt.ItemDataRole.UserRole)
-        field = self.table.horizontalHeaderItem(item.column()).text()
+    def remove_file_entries(self, indices):
+        """Remove all_files entries by index, touching only the affected table rows."""
+        removed = sorted(set(indices))
+        removed_set = set(removed)
+        had_selection = self.table.selectionModel().hasSelection()
+        # Drop the visible rows first, while their indices still match all_files
+        self.table_model.remove_original_indices(removed_set)
+        self.all_files = [f for i, f in enumerate(self.all_files) if i not in removed_set]
+        self._mutation_counter += 1
+        # Each surviving index moves down by the number of removed indices below it
+        self.filtered_rows[:] = [i - bisect_left(removed, i) for i in self.filtered_rows]
+        if had_selection:
+            self.on_selection_changed()
+    def insert_file_entries(self, entries):
+        """Re-insert (index, file_path, metadata) entries, e.g. when undoing a removal."""
+        entries = sorted(
+            ((index, FileEntry.from_path(file_path, metadata))
+             for index, file_path, metadata in entries),
+            key=itemgetter(0)
+        )
+        for index, entry in entries:
+            self.all_files.insert(index, entry)
+        self._mutation_counter += 1
+        # Entry k landed at index p_k; an old index j moved up once per p_k - k <= j
+        shifts = [index - k for k, (index, _) in enumerate(entries)]
+        self.filtered_rows[:] = [j + bisect_right(shifts, j) for j in self.filtered_rows]
+        matches = self._row_filter()
+        for index, entry in entries:
+            if matches is None or matches(entry):
+                self.table_model.insert_row(bisect_left(self.filtered_rows, index), index)
+    def update_metadata(self, original_index, field, text):
+        """Edit field of all_files[original_index] (a file index, not a view row) via undo."""
         if field == "Filename":
-            self.rename_file(original_index, item.text())
+            self.rename_file(original_index, text)
         else:
-            old_val = self.all_files[original_index][1].get(field, "")
-            if str(old_val) != item.text():
-                cmd = MetadataEditCommand(self, original_index, field, old_val, item.text())
+            old_val = self.all_files[original_index].metadata.get(field, "")
+            if str(old_val) != text:
+                cmd = MetadataEditCommand(self, original_index, field, old_val, text)
                 self.undo_redo_stack.push(cmd)
                 self.update_undo_redo_buttons()
     def rename_file(self, idx, name): # TODO: Add docstring
-        op = self.all_files[idx][0]
+        op = self.all_files[idx].path
         np = os.path.join(os.path.dirname(op), name)
         if op != np:
             cmd = FileRenameCommand(self, idx, op, np)
@@ -1381,8 +1696,8 @@ class AudioMetadataEditor(QMainWindow):
         if not self.changes_pending:
             return
         try:
-            for fp, meta in self.all_files:
-                wav_metadata.write_wav_metadata(fp, meta)
+            for entry in self.all_files:
+                wav_metadata.write_wav_metadata(entry.path, entry.metadata)
             self.changes_pending = False
             self.status_label.setText("Changes saved.")
         except IOError as e:
@@ -1391,10 +1706,10 @@ class AudioMetadataEditor(QMainWindow):
             QMessageBox.critical(self, "Save Error", f"An unexpected error occurred during save: {e}")
 
     def get_selected_actual_rows(self): # TODO: Add docstring
-        return sorted(list({
-            self.table.item(i.row(), 0).data(Qt.ItemDataRole.UserRole)
-            for i in self.table.selectedIndexes()
-        }))
+        filtered_rows = self.filtered_rows
+        return sorted({
+            filtered_rows[i.row()] for i in self.table.selectionModel().selectedRows()
+        })
     def prompt_remove_files(self): # TODO: Add docstring
         rows = self.get_selected_actual_rows()
         if not rows:
@@ -1406,7 +1721,7 @@ class AudioMetadataEditor(QMainWindow):
         )
         if reply == QMessageBox.StandardButton.Yes:
             files_to_remove_data = [
-                (i, self.all_files[i][0], self.all_files[i][1]) for i in rows
+                (i, self.all_files[i].path, self.all_files[i].metadata) for i in rows
             ]
             cmd = FileRemoveCommand(self, files_to_remove_data)
             self.undo_redo_stack.push(cmd)
@@ -1417,7 +1732,7 @@ class AudioMetadataEditor(QMainWindow):
     def toggle_dark_mode(self): # TODO: Add docstring
         self.current_theme = 'light' if self.current_theme == 'dark' else 'dark'
         self.theme = self.THEMES[self.current_theme]
-        self.apply_stylesheet()
+        self.stylesheet_timer.start()
         if hasattr(self, 'mirror_panel'):
             self.mirror_panel.update() # TODO: ensure mirror_panel has an update method
     def update_animated_button_styles(self): # TODO: Add docstring
@@ -1444,6 +1759,7 @@ class AudioMetadataEditor(QMainWindow):
                 return
         if hasattr(self, 'agent_manager'):
             self.agent_manager.stop_agents()
+        self.shutdown_metadata_pool()
         event.accept()
     def setup_agent_manager(self):
         """Initialize and start the background agent system."""
@@ -1453,7 +1769,7 @@ class AudioMetadataEditor(QMainWindow):
             if self.all_files:
                 self.agent_manager.start_agents()
         except Exception as e: # More specific logging for agent setup
-            print(f"Error setting up agent manager: {type(e).__name__} - {e}")
+            logger.error("Error setting up agent manager: %s - %s", type(e).__name__, e)
 
     def on_agent_status_changed(self, status):
         """Handle status updates from background agents."""
@@ -1461,30 +1777,19 @@ class AudioMetadataEditor(QMainWindow):
 
     def update_filename_in_table(self, idx, name):
         """Update filename in table for a specific file index."""
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 0)  # filename column
-            if item and item.data(Qt.ItemDataRole.UserRole) == idx:
-                item.setText(name)
-                break
+        self._forget_row_keys(self.all_files[idx].path)
+        self._mutation_counter += 1
+        # The model reads the name from all_files; only a repaint is needed
+        self._refresh_cell(idx, self.COLUMN_INDEX["Filename"])
 
     def update_table_cell(self, idx, field, value):
         """Update a specific cell in the table for a file index and field."""
-        field_column = -1
-        for col in range(self.table.columnCount()):
-            if self.table.horizontalHeaderItem(col).text() == field:
-                field_column = col
-                break
-
-        if field_column == -1:
+        self._forget_row_keys(self.all_files[idx].path)
+        self._mutation_counter += 1
+        field_column = self.COLUMN_INDEX.get(field)
+        if field_column is None:
             return
-
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 0)
-            if item and item.data(Qt.ItemDataRole.UserRole) == idx:
-                target_item = self.table.item(row, field_column)
-                if target_item:
-                    target_item.setText(str(value))
-                break
+        self._refresh_cell(idx, field_column)
 
     def undo_last_change(self):
         """Undo the last change operation."""
@@ -1523,10 +1828,8 @@ class AudioMetadataEditor(QMainWindow):
         menu = QMenu(self)
         menu.addAction("All", lambda: self.set_search_field("All"))
 
-        for col in range(self.table.columnCount()):
-            header = self.table.horizontalHeaderItem(col)
-            if header and header.text() != "File Path":
-                field_name = header.text()
+        for field_name in self.COLUMNS:
+            if field_name != "File Path":
                 menu.addAction(field_name, lambda f=field_name: self.set_search_field(f))
 
         container_rect = self.search_container.geometry()
@@ -1537,6 +1840,7 @@ class AudioMetadataEditor(QMainWindow):
 
     def set_search_field(self, field):
         """Set the current search field and update button text."""
+        self.search_field = field
         self.search_field_btn.setText(f"{field} ▼")
         self.filter_table()
 
@@ -1556,18 +1860,17 @@ class AudioMetadataEditor(QMainWindow):
             success_count = 0
             error_count = 0
 
+            # The destination is the same for every file; create it once up front
+            day_folder = f"Day{day_number:02d}"
+            takes_folder = "Takes"
+            dest_path = os.path.join(destination_dir, day_folder, takes_folder)
+            os.makedirs(dest_path, exist_ok=True)
+
             for i, row_idx in enumerate(selected_rows):
                 if progress.wasCanceled():
                     break
 
-                file_path, _ = self.all_files[row_idx] # metadata not used
-                filename = os.path.basename(file_path)
-
-                day_folder = f"Day{day_number:02d}"
-                takes_folder = "Takes"
-                dest_path = os.path.join(destination_dir, day_folder, takes_folder)
-
-                os.makedirs(dest_path, exist_ok=True)
+                file_path, _, filename = self.all_files[row_idx] # metadata not used
 
                 dest_file = os.path.join(dest_path, filename)
                 try:
@@ -1576,13 +1879,13 @@ class AudioMetadataEditor(QMainWindow):
                         success_count += 1
                     else:
                         error_count += 1
-                        print(f"Skipped existing file: {filename}")
+                        logger.info("Skipped existing file: %s", filename)
                 except IOError as e: # Specific exception for I/O errors
                     error_count += 1
-                    print(f"I/O error copying {filename}: {e}")
+                    logger.warning("I/O error copying %s: %s", filename, e)
                 except Exception as e:
                     error_count += 1
-                    print(f"Error copying {filename}: {e}")
+                    logger.warning("Error copying %s: %s", filename, e)
 
                 progress.setValue(i + 1)
                 progress.setLabelText(f"Copying: {filename}")
@@ -1658,10 +1961,9 @@ class AudioMetadataEditor(QMainWindow):
                     if os.path.isfile(path) and path.lower().endswith(('.wav', '.wave')):
                         file_paths.append(path)
                     elif os.path.isdir(path):
-                        for root, _dirs, files in os.walk(path): # dirs unused
-                            for file_item in files: # renamed file to file_item
-                                if file_item.lower().endswith('.wav'):
-                                    file_paths.append(os.path.join(root, file_item))
+                        file_paths.extend(
+                            wav_metadata.iter_wav_files(path, onerror=_log_unlistable_folder)
+                        )
 
             if file_paths:
                 self.load_files_from_paths(file_paths)
@@ -1726,7 +2028,7 @@ class FileWatcherAgent(BackgroundAgent):
     def run(self):
         """Runs the file watcher agent."""
         self.is_active = True
-        file_paths = [fp for fp, _ in self.editor.all_files]
+        file_paths = [entry.path for entry in self.editor.all_files]
         if file_paths:
             self.watcher.addPaths(file_paths)
             self.watcher.fileChanged.connect(self.on_file_changed)
@@ -1750,10 +2052,10 @@ class ValidationAgent(BackgroundAgent):
             self.msleep(self.interval)
             if self.is_active:
                 try:
-                    missing_files = 0
-                    for file_path, _ in self.editor.all_files:
-                        if not os.path.exists(file_path):
-                            missing_files += 1
+                    missing_files = sum(
+                        1 for entry in self.editor.all_files
+                        if not os.path.exists(entry.path)
+                    )
 
                     if missing_files > 0:
                         self.status_changed.emit(f"Warning: {missing_files} files missing")
@@ -1782,7 +2084,7 @@ class BackgroundAgentManager(QObject):
                 agent.status_changed.connect(self.status_changed.emit)
                 agent.error_occurred.connect(self.status_changed.emit)
                 agent.start()
-                print(f"{agent_name.capitalize()} agent started.")
+                logger.info("%s agent started.", agent_name.capitalize())
 
 
             self.status_changed.emit("Background agents started")
@@ -1793,7 +2095,7 @@ class BackgroundAgentManager(QObject):
         """Stop all background agents."""
         for agent_name, agent in self.agents.items(): # Iterate with name for better logging
             agent.stop_agent()
-            print(f"{agent_name.capitalize()} agent stopped.")
+            logger.info("%s agent stopped.", agent_name.capitalize())
         self.agents.clear()
         self.status_changed.emit("Background agents stopped")
 
@@ -1844,43 +2146,58 @@ class FilenameParser:
         }
     }
 
+    # Compiled once so per-file parsing skips the re module's cache lookup
+    COMPILED_PATTERNS = {
+        name: re.compile(info["pattern"], re.IGNORECASE) for name, info in PATTERNS.items()
+    }
+
     @classmethod
     def parse_filename(cls, filename, pattern_name):
         """Parse a filename using the specified pattern."""
-        # Imports are already at module level
+        return cls.parse_basename(os.path.basename(filename), pattern_name)
+
+    @classmethod
+    def parse_basename(cls, basename, pattern_name):
+        """Parse a name that is already stripped of its directory."""
         if pattern_name not in cls.PATTERNS:
             return {}
 
-        pattern_info = cls.PATTERNS[pattern_name]
-        pattern_regex = pattern_info["pattern"] # Renamed pattern to pattern_regex
-        fields = pattern_info["fields"]
-
-        basename = os.path.basename(filename)
+        return dict(cls._match_basename(basename, pattern_name))
 
-        match = re.match(pattern_regex, basename, re.IGNORECASE)
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _match_basename(cls, basename, pattern_name):
+        """Return the (field, value) pairs a pattern extracts from a basename."""
+        # Preview and apply parse the same names repeatedly; results are cached
+        # as tuples so callers always get their own dict from parse_filename.
+        match = cls.COMPILED_PATTERNS[pattern_name].match(basename)
         if not match:
-            return {}
+            return ()
 
-        result = {}
-        for i, field in enumerate(fields):
-            if i < len(match.groups()):
-                value = match.group(i + 1).strip()
+        result = []
+        groups = match.groups()
+        for i, field in enumerate(cls.PATTERNS[pattern_name]["fields"]):
+            if i < len(groups):
+                value = groups[i].strip()
                 if value:
-                    result[field] = value
+                    result.append((field, value))
 
-        return result
+        return tuple(result)
 
     @classmethod
     def preview_extraction(cls, filenames, pattern_name):
         """Preview what would be extracted from a list of filenames."""
-        results = []
-        for filename in filenames:
-            parsed = cls.parse_filename(filename, pattern_name)
-            results.append({
-                'filename': os.path.basename(filename),
-                'extracted': parsed
-            })
-        return results
+        return cls.preview_basenames(
+            [os.path.basename(filename) for filename in filenames], pattern_name
+        )
+
+    @classmethod
+    def preview_basenames(cls, basenames, pattern_name):
+        """Preview extraction for names already stripped of their directory."""
+        return [
+            {'filename': basename, 'extracted': cls.parse_basename(basename, pattern_name)}
+            for basename in basenames
+        ]
 
 class FilenameExtractorDialog(QDialog):
     """Dialog for extracting metadata from filenames."""
@@ -1915,8 +2232,16 @@ class FilenameExtractorDialog(QDialog):
 
         self.preview_table = QTableWidget()
         self.preview_table.setMaximumHeight(200)
+        preview_header = self.preview_table.horizontalHeader()
+        preview_header.setMinimumSectionSize(80)
+        preview_header.setDefaultSectionSize(120)
+        preview_header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         preview_layout.addWidget(self.preview_table)
 
+        # Inline feedback instead of modal popups for preview/validation state
+        self.status_label = QLabel("")
+        preview_layout.addWidget(self.status_label)
+
         layout.addWidget(preview_group)
 
         options_group = QGroupBox("Options")
@@ -1951,21 +2276,15 @@ class FilenameExtractorDialog(QDialog):
 
         self.update_preview()
 
-    def get_target_files(self):
-        """Get the list of files to process."""
+    def get_target_entries(self):
+        """Get (all_files index, FileEntry) pairs for the files to process."""
         if not self.parent_editor or not hasattr(self.parent_editor, 'all_files'):
             return []
 
+        all_files = self.parent_editor.all_files
         if self.selected_only_cb.isChecked():
-            selected_indices = {item.row() for item in self.parent_editor.table.selectedItems()}
-            # Map visual row index to actual all_files index
-            files = [
-                self.parent_editor.all_files[self.parent_editor.table.item(row, 0).data(Qt.ItemDataRole.UserRole)][0]
-                for row in selected_indices
-                if row < self.parent_editor.table.rowCount() and self.parent_editor.table.item(row, 0)
-            ]
-            return files
-        return [file_path for file_path, _ in self.parent_editor.all_files]
+            return [(i, all_files[i]) for i in self.parent_editor.get_selected_actual_rows()]
+        return list(enumerate(all_files))
 
     def update_preview(self):
         """Update the preview table."""
@@ -1976,48 +2295,59 @@ class FilenameExtractorDialog(QDialog):
         if not pattern_name:
             return
 
-        files = self.get_target_files()
-        if not files:
+        targets = self.get_target_entries()
+        if not targets:
             self.preview_table.setRowCount(0)
             self.preview_table.setColumnCount(0)
+            self.status_label.setText("No files to preview.")
             return
 
-        results = FilenameParser.preview_extraction(files, pattern_name)
+        results = FilenameParser.preview_basenames(
+            [entry.basename for _, entry in targets], pattern_name
+        )
 
         if results:
-            all_fields = set()
-            for result in results:
-                all_fields.update(result['extracted'].keys())
-            all_fields_list = sorted(list(all_fields)) # Renamed to avoid conflict
-
-            self.preview_table.setColumnCount(len(all_fields_list) + 1)
-            headers = ['Filename'] + all_fields_list
-            self.preview_table.setHorizontalHeaderLabels(headers)
-
-            self.preview_table.setRowCount(min(len(results), 10))
-
-            for row, result in enumerate(results[:10]):
-                item = QTableWidgetItem(result['filename'])
-                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.preview_table.setItem(row, 0, item)
-
-                for col, field in enumerate(all_fields_list, 1):
-                    value = result['extracted'].get(field, '')
-                    item = QTableWidgetItem(str(value))
+            all_fields = {field for result in results for field in result['extracted']}
+            all_fields_list = sorted(all_fields) # Renamed to avoid conflict
+
+            preview = self.preview_table
+            # Rebuild the preview with repaints and item signals suspended
+            preview.setUpdatesEnabled(False)
+            preview.blockSignals(True)
+            try:
+                preview.setColumnCount(len(all_fields_list) + 1)
+                headers = ['Filename'] + all_fields_list
+                preview.setHorizontalHeaderLabels(headers)
+
+                preview.setRowCount(min(len(results), 10))
+
+                for row, result in enumerate(results[:10]):
+                    item = QTableWidgetItem(result['filename'])
                     item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                    self.preview_table.setItem(row, col, item)
+                    preview.setItem(row, 0, item)
+
+                    for col, field in enumerate(all_fields_list, 1):
+                        value = result['extracted'].get(field, '')
+                        item = QTableWidgetItem(str(value))
+                        item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+                        preview.setItem(row, col, item)
+            finally:
+                preview.blockSignals(False)
+                preview.setUpdatesEnabled(True)
 
-            self.preview_table.resizeColumnsToContents()
+            preview.resizeColumnToContents(0)  # Filename only
 
             matched_count = sum(1 for r in results if r['extracted'])
             total_count = len(results)
-            # status_text = f"Matched: {matched_count}/{total_count} files" # status_text unused
-            # if total_count > 10:
-            #     status_text += " (showing first 10)"
+            status_text = f"Matched: {matched_count}/{total_count} files"
+            if total_count > 10:
+                status_text += " (showing first 10)"
+            self.status_label.setText(status_text)
 
         else:
             self.preview_table.setRowCount(0)
             self.preview_table.setColumnCount(0)
+            self.status_label.setText("")
 
     def apply_extraction(self):
         """Apply the extraction to files."""
@@ -2028,48 +2358,35 @@ class FilenameExtractorDialog(QDialog):
         if not pattern_name:
             return
 
-        files_to_process = self.get_target_files() # Renamed to avoid conflict
-        if not files_to_process:
-            QMessageBox.warning(self, "No Files", "No files selected for extraction.")
+        targets = self.get_target_entries()
+        if not targets:
+            self.status_label.setText("No files selected for extraction.")
             return
 
         commands = []
         extracted_count = 0
+        # Loop invariants: read the option and the editor once, not per field
+        editor = self.parent_editor
+        overwrite = self.overwrite_cb.isChecked()
 
-        for file_path in files_to_process:
-            file_index = None
-            for i, (fp, _) in enumerate(self.parent_editor.all_files):
-                if fp == file_path:
-                    file_index = i
-                    break
-
-            if file_index is None:
-                continue
+        for file_index, entry in targets:
+            current_metadata = entry.metadata
 
-            extracted = FilenameParser.parse_filename(file_path, pattern_name)
+            # FileEntry already carries the basename; no per-file path parsing
+            extracted = FilenameParser.parse_basename(entry.basename, pattern_name)
             if not extracted:
                 continue
 
-            current_metadata = self.parent_editor.all_files[file_index][1]
-
             file_had_extraction = False # Flag to track if any field was extracted for this file
             for field, value in extracted.items():
-                # Ensure field is a valid column in the table (excluding "File Path")
-                # This check might be too restrictive if patterns extract fields not in table
-                # valid_fields = [self.parent_editor.table.horizontalHeaderItem(c).text()
-                #                 for c in range(self.parent_editor.table.columnCount())
-                #                 if self.parent_editor.table.horizontalHeaderItem(c).text() != "File Path"]
-                # if field not in valid_fields:
-                #     continue
-
                 old_value = current_metadata.get(field, '')
 
-                if not self.overwrite_cb.isChecked() and old_value:
+                if not overwrite and old_value:
                     continue
 
                 if old_value != value:
                     cmd = MetadataEditCommand(
-                        self.parent_editor, file_index, field, old_value, value
+                        editor, file_index, field, old_value, value
                     )
                     commands.append(cmd)
                     file_had_extraction = True
@@ -2092,8 +2409,6 @@ class FilenameExtractorDialog(QDialog):
         elif len(commands) == 1:
             self.parent_editor.undo_redo_stack.push(commands[0])
 
-
-        self.parent_editor.update_table() # update_table was called filter_table before
         self.parent_editor.update_undo_redo_buttons()
 
         QMessageBox.information(
@@ -2106,6 +2421,7 @@ class FilenameExtractorDialog(QDialog):
 
 def main():
     """Main function to run the application."""
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
     app = QApplication(sys.argv)
     window = AudioMetadataEditor()
     window.show()
@@ -7,7 +7,6 @@ This script analyzes WAV files and provides diagnostics about metadata structure
 
 import os
 import sys
-import glob
 import argparse
 import time
 import json
@@ -16,6 +15,7 @@ from concurrent.futures import ThreadPoolExecutor
 import multiprocessing
 import traceback
 from wavinfo import WavInfoReader
+from wav_metadata import iter_wav_files
 
 
 def analyze_wav_file(wav_path, debug=False):
@@ -208,9 +208,8 @@ def main():
         
         files = [args.path]
     else:
-        # Directory - find WAV files
-        pattern = "**/*.wav" if args.recursive else "*.wav"
-        files = glob.glob(os.path.join(args.path, pattern), recursive=args.recursive)
+        # Directory - find WAV files (any extension case), same walk as the app
+        files = sorted(iter_wav_files(args.path, recursive=args.recursive))
         
         if not files:
             print(f"Error: No WAV files found in {args.path}")
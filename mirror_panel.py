@@ -116,9 +116,16 @@ class MirrorPanel(QWidget):
     def browse_destination(self):
         """Browse for destination directory"""
         folder_path = QFileDialog.getExistingDirectory(self, "Select Destination Folder")
-        if folder_path:
-            self.dest_input.setText(folder_path)
-            self.destination_dir = folder_path
+        if not folder_path:
+            return
+        # Validate once here so the mirror operations never stat a missing
+        # (possibly network) location for every file they copy.
+        if not os.path.isdir(folder_path):
+            QMessageBox.warning(self, "Invalid Destination",
+                                f"The selected folder is not accessible:\n{folder_path}")
+            return
+        self.dest_input.setText(folder_path)
+        self.destination_dir = folder_path
     
     def mirror_for_qcode(self):
         if not self.destination_dir:
@@ -0,0 +1,271 @@
+import unittest
+import os
+import sys
+import random
+import tempfile
+from unittest import mock
+
+# Render widgets without a display so the editor can be built headless
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Add the parent directory to sys.path to allow importing app
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication
+
+import app
+
+qt_app = QApplication.instance() or QApplication([])
+
+def write_file(path, data):
+    """Create path holding data."""
+    with open(path, 'wb') as f:
+        f.write(data)
+
+def read_file(path):
+    """Return the bytes stored at path."""
+    with open(path, 'rb') as f:
+        return f.read()
+
+def make_editor(entries):
+    """Build an editor showing entries, unsorted and unfiltered."""
+    editor = app.AudioMetadataEditor()
+    editor.all_files = list(entries)
+    editor.filter_table()
+    return editor
+
+def set_search(editor, text, field="All"):
+    """Set the search box and field without waiting for the debounce timer."""
+    editor.search_field = field
+    editor.search_input.blockSignals(True)
+    editor.search_input.setText(text)
+    editor.search_input.blockSignals(False)
+    editor.filter_table()
+
+def refiltered_rows(editor):
+    """Return the rows a from-scratch filter of all_files would show."""
+    matches = editor._row_filter()
+    return [i for i, entry in enumerate(editor.all_files) if matches is None or matches(entry)]
+
+class TestRenameWithoutOverwrite(unittest.TestCase):
+    """Test suite for renaming files without clobbering an existing target."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.old_path = os.path.join(self.tmp.name, "old.wav")
+        self.new_path = os.path.join(self.tmp.name, "new.wav")
+        write_file(self.old_path, b"old")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_rename_to_free_name(self):
+        """Test that a rename to an unused name moves the file."""
+        app.rename_without_overwrite(self.old_path, self.new_path)
+        self.assertFalse(os.path.exists(self.old_path), "Source should be gone after the rename.")
+        self.assertEqual(read_file(self.new_path), b"old")
+
+    def test_rename_onto_existing_name(self):
+        """Test that a rename onto an existing file raises and leaves both files intact."""
+        write_file(self.new_path, b"new")
+        with self.assertRaises(FileExistsError):
+            app.rename_without_overwrite(self.old_path, self.new_path)
+        self.assertEqual(read_file(self.old_path), b"old")
+        self.assertEqual(read_file(self.new_path), b"new", "Existing target must not be overwritten.")
+
+    def test_editor_rename_onto_existing_name(self):
+        """Test that renaming a row onto an existing file reports it and keeps the entry."""
+        write_file(self.new_path, b"new")
+        editor = app.AudioMetadataEditor()
+        entry = app.FileEntry.from_path(self.old_path, {"Scene": "1"})
+        editor.all_files = [entry]
+        editor.filter_table()
+        with mock.patch.object(app.QMessageBox, "critical") as critical:
+            editor.rename_file(0, "new.wav")
+        critical.assert_called_once()
+        self.assertEqual(editor.all_files, [entry])
+        self.assertEqual(read_file(self.old_path), b"old")
+        self.assertEqual(read_file(self.new_path), b"new")
+
+class TestIncrementalRemoval(unittest.TestCase):
+    """Test suite for keeping filtered rows in step with removals and their undo."""
+
+    def assert_rows_consistent(self, editor):
+        """Check the visible rows against a full refilter."""
+        self.assertEqual(editor.filtered_rows, refiltered_rows(editor))
+        self.assertEqual(editor.table_model.rowCount(), len(editor.filtered_rows))
+
+    def test_remove_undo_redo_then_filter(self):
+        """Test remove, undo and redo against a full refilter, then refilter."""
+        rng = random.Random(1)
+        for _ in range(50):
+            entries = [
+                app.FileEntry.from_path(f"/x/{i}.wav", {"Scene": rng.choice(["ab", "ba", "bb"])})
+                for i in range(rng.randint(0, 15))
+            ]
+            editor = make_editor(entries)
+            set_search(editor, rng.choice(["", "ab", "b"]), rng.choice(["All", "Scene"]))
+            removed = rng.sample(range(len(entries)), rng.randint(0, len(entries)))
+            editor.undo_redo_stack.push(app.FileRemoveCommand(
+                editor, [(i, entries[i].path, entries[i].metadata) for i in removed]
+            ))
+            self.assertEqual(len(editor.all_files), len(entries) - len(removed))
+            self.assert_rows_consistent(editor)
+            editor.undo_last_change()
+            self.assertEqual(editor.all_files, entries)
+            self.assert_rows_consistent(editor)
+            editor.redo_last_change()
+            self.assert_rows_consistent(editor)
+            set_search(editor, rng.choice(["", "ba", "a"]), editor.search_field)
+            self.assert_rows_consistent(editor)
+            editor.undo_last_change()
+            self.assertEqual(editor.all_files, entries)
+            self.assert_rows_consistent(editor)
+
+class TestSortKeys(unittest.TestCase):
+    """Test suite for the per-column sort keys."""
+
+    def sort_takes(self, takes, descending=False):
+        """Return the Take values of takes sorted by the Take column."""
+        entries = [app.FileEntry.from_path(f"/x/{i}.wav", {"Take": take}) for i, take in enumerate(takes)]
+        col = app.AudioMetadataEditor.COLUMN_INDEX["Take"]
+        order, _ = app.sorted_order(entries, col, descending, {}, app.AudioMetadataEditor.SORT_KEYS)
+        return [entries[i].metadata["Take"] for i in order]
+
+    def test_mixed_int_and_str_takes(self):
+        """Test that int and str Take values sort without a TypeError, numbers first."""
+        takes = ["b", 10, "2", "A", 3, "", "1a"]
+        self.assertEqual(self.sort_takes(takes), ["2", 3, 10, "", "1a", "A", "b"])
+        self.assertEqual(self.sort_takes(takes, descending=True), ["b", "A", "1a", "", 10, 3, "2"])
+
+    def test_editor_sorts_mixed_takes(self):
+        """Test sorting the editor by a Take column holding ints and strs."""
+        editor = make_editor(
+            app.FileEntry.from_path(f"/x/{i}.wav", {"Take": take}) for i, take in enumerate([7, "x", "12", 1])
+        )
+        editor.current_sort_column_index = editor.COLUMN_INDEX["Take"]
+        editor.apply_current_sort()
+        self.assertEqual([entry.metadata["Take"] for entry in editor.all_files], [1, 7, "12", "x"])
+
+    def test_filename_sort_uses_basename(self):
+        """Test that the Filename column sorts by basename, ignoring case and directory."""
+        entries = [app.FileEntry.from_path(path, {}) for path in ["/b/a2.wav", "/a/B1.wav", "/c/A1.wav"]]
+        col = app.AudioMetadataEditor.COLUMN_INDEX["Filename"]
+        order, _ = app.sorted_order(entries, col, False, {}, app.AudioMetadataEditor.SORT_KEYS)
+        self.assertEqual([entries[i].basename for i in order], ["A1.wav", "a2.wav", "B1.wav"])
+
+class TestSortPermutation(unittest.TestCase):
+    """Test suite for reordering rows in place after a sort."""
+
+    def setUp(self):
+        rng = random.Random(2)
+        self.editor = make_editor(
+            app.FileEntry.from_path(
+                f"/x/{rng.randint(0, 999)}_{i}.wav",
+                {"Scene": rng.choice(["a", "B", "ab", "c"]), "Take": rng.choice([1, "2", "10", "x"])}
+            )
+            for i in range(40)
+        )
+        set_search(self.editor, "a", "Scene")
+
+    def visible_paths(self):
+        """Return the paths of the visible rows, in display order."""
+        return [self.editor.all_files[i].path for i in self.editor.filtered_rows]
+
+    def sort_by(self, field, order):
+        """Sort the editor by field in order."""
+        self.editor.current_sort_column_index = self.editor.COLUMN_INDEX[field]
+        self.editor.current_sort_order = order
+        self.editor.apply_current_sort()
+
+    def test_sort_keeps_filtered_files(self):
+        """Test that sorting reorders all_files but still shows the same files, ascending."""
+        visible = set(self.visible_paths())
+        for field, order in [
+            ("Scene", Qt.SortOrder.AscendingOrder),
+            ("Scene", Qt.SortOrder.DescendingOrder),  # Direction-only toggle: reversed in place
+            ("Take", Qt.SortOrder.DescendingOrder),
+            ("Filename", Qt.SortOrder.AscendingOrder),
+        ]:
+            self.sort_by(field, order)
+            col = self.editor.COLUMN_INDEX[field]
+            keys = [self.editor.SORT_KEYS[col](entry) for entry in self.editor.all_files]
+            self.assertEqual(keys, sorted(keys, reverse=order == Qt.SortOrder.DescendingOrder))
+            self.assertEqual(self.editor.filtered_rows, refiltered_rows(self.editor))
+            self.assertEqual(set(self.visible_paths()), visible)
+            self.assertEqual(self.editor.table_model.rowCount(), len(visible))
+
+    def test_selection_follows_sort(self):
+        """Test that selected rows keep pointing at the same files after a sort."""
+        table = self.editor.table
+        table.setSelectionMode(table.SelectionMode.MultiSelection)
+        for row in (0, 3, 5):
+            table.selectRow(row)
+        selected = {self.editor.all_files[i].path for i in self.editor.get_selected_actual_rows()}
+        self.assertEqual(len(selected), 3)
+        self.sort_by("Take", Qt.SortOrder.DescendingOrder)
+        self.assertEqual(
+            {self.editor.all_files[i].path for i in self.editor.get_selected_actual_rows()}, selected
+        )
+
+    def test_mirror_panel_follows_sort(self):
+        """Test that the mirror panel's rows name the selected files after each kind of sort."""
+        self.editor.show()
+        self.addCleanup(self.editor.close)
+        self.editor.toggle_mirror_panel()
+        table = self.editor.table
+        table.setSelectionMode(table.SelectionMode.MultiSelection)
+        for row in (1, 4):
+            table.selectRow(row)
+        selected = {self.editor.all_files[i].path for i in self.editor.get_selected_actual_rows()}
+        for field, order in [
+            ("Scene", Qt.SortOrder.AscendingOrder),
+            ("Scene", Qt.SortOrder.DescendingOrder),  # Direction-only toggle
+            ("Filename", Qt.SortOrder.AscendingOrder),
+        ]:
+            self.sort_by(field, order)
+            mirrored = {self.editor.all_files[i].path for i in self.editor.mirror_panel.selected_rows}
+            self.assertEqual(mirrored, selected, field)
+
+class TestIncrementalSearch(unittest.TestCase):
+    """Test suite for narrowing the previous search results as the query grows."""
+
+    def setUp(self):
+        rng = random.Random(3)
+        self.editor = make_editor(
+            app.FileEntry.from_path(
+                f"/x/{''.join(rng.choices('abc', k=3))}_{i}.wav",
+                {"Scene": "".join(rng.choices("abcAB", k=4)), "Take": rng.randint(1, 20)}
+            )
+            for i in range(60)
+        )
+
+    def type_queries(self, queries, field):
+        """Search for each query in turn, checking each result against a full refilter."""
+        for query in queries:
+            set_search(self.editor, query, field)
+            self.assertEqual(self.editor.filtered_rows, refiltered_rows(self.editor), query)
+            self.assertEqual(self.editor.table_model.rowCount(), len(self.editor.filtered_rows))
+
+    def test_grow_narrow_shrink(self):
+        """Test a query that grows, narrows and then shrinks, in every search field."""
+        queries = ["", "a", "ab", "abc", "ABCA", "ab", "a", "", "b", "ba", "bab", "c"]
+        for field in ["All", "Filename", "Scene", "Take"]:
+            self.type_queries(queries, field)
+        self.type_queries(["1", "12", "1", "2"], "Take")
+
+    def test_edit_between_keystrokes(self):
+        """Test that an edit made mid-query is seen once the query grows again."""
+        self.type_queries(["ab"], "Scene")
+        hidden = next(i for i, entry in enumerate(self.editor.all_files)
+                      if "ab" not in entry.metadata["Scene"].casefold())
+        self.editor.update_metadata(hidden, "Scene", "ABCAB")
+        self.type_queries(["abc", "abca", "abcab"], "Scene")
+        self.assertIn(hidden, self.editor.filtered_rows)
+        self.editor.undo_last_change()
+        self.type_queries(["abcab", "ab"], "Scene")
+        self.assertNotIn(hidden, self.editor.filtered_rows)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 import os
 import sys
+import tempfile
 
 # Add the parent directory to sys.path to allow importing wav_metadata
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -36,5 +37,54 @@ class TestWavMetadata(unittest.TestCase):
     # or using mocking, which might be complex with the current tool limitations.
     # For now, we'll skip this more complex test.
 
+class TestIterWavFiles(unittest.TestCase):
+    """Test suite for discovering WAV files under a folder."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = self.root = self.tmp.name
+        for rel in ["a.wav", "B.WAV", "notes.txt", "sub/c.wav", "sub/deeper/d.Wav", "sub/e.wav.bak"]:
+            path = os.path.join(root, *rel.split("/"))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            open(path, 'wb').close()
+        os.makedirs(os.path.join(root, "folder.wav"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def walked_wav_files(self):
+        """Return the .wav files os.walk finds under the root."""
+        return sorted(
+            os.path.join(dirpath, name)
+            for dirpath, _, filenames in os.walk(self.root)
+            for name in filenames if name.lower().endswith('.wav')
+        )
+
+    def test_matches_os_walk(self):
+        """Test that the scandir walk finds the same files as os.walk."""
+        found = sorted(wav_metadata.iter_wav_files(self.root))
+        self.assertEqual(found, self.walked_wav_files())
+        self.assertEqual(len(found), 4)
+
+    def test_non_recursive(self):
+        """Test that recursive=False lists only the folder itself, in any extension case."""
+        found = sorted(wav_metadata.iter_wav_files(self.root, recursive=False))
+        self.assertEqual(found, [os.path.join(self.root, "B.WAV"), os.path.join(self.root, "a.wav")])
+
+    def test_skips_symlinked_directories(self):
+        """Test that symlinked directories are not descended into, like os.walk."""
+        try:
+            os.symlink(os.path.join(self.root, "sub"), os.path.join(self.root, "link"))
+        except (OSError, NotImplementedError):
+            self.skipTest("Symlinks are not supported here")
+        self.assertEqual(sorted(wav_metadata.iter_wav_files(self.root)), self.walked_wav_files())
+
+    def test_missing_root(self):
+        """Test that a folder that cannot be listed yields nothing and is reported to onerror."""
+        missing = os.path.join(self.root, "missing")
+        errors = []
+        self.assertEqual(list(wav_metadata.iter_wav_files(missing, onerror=errors.append)), [])
+        self.assertEqual([e.filename for e in errors], [missing])
+
 if __name__ == '__main__':
     unittest.main()
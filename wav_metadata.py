@@ -20,6 +20,20 @@ import soundfile as sf # type: ignore
 # import wave
 # import numpy as np
 
+# Patterns applied to every file's BEXT/INFO text, compiled once at import
+_SHOW_RE = re.compile(r'(?:SHOW|PROGRAM|SERIES)[:\s]+(\w[^,;\r\n]*)', re.IGNORECASE)
+_SCENE_TAKE_RE = re.compile(r'S(?:C|CNE)?[_\s]*(\d+)[_\s]*T(?:K|AKE)?[_\s]*(\d+)', re.IGNORECASE)
+_SCENE_LABEL_RE = re.compile(r'SC(?:ENE|N)?[:\s]+(\w+)', re.IGNORECASE)
+_TAKE_LABEL_RE = re.compile(r'T(?:AKE|K)?[:\s]+(\w+)', re.IGNORECASE)
+_CATEGORY_RE = re.compile(r'(?:CAT(?:EGORY)?|TYPE)[:\s]+(\w[^,;\r\n]*)', re.IGNORECASE)
+_SUBCATEGORY_RE = re.compile(r'(?:SUB(?:CAT(?:EGORY)?)?|SUBTYPE)[:\s]+(\w[^,;\r\n]*)', re.IGNORECASE)
+
+# RIFF chunk header: FourCC id + little-endian uint32 size, compiled once
+_CHUNK_HEADER = struct.Struct('<4sI')
+# Read buffer for the chunk walk; large enough that the RIFF header plus the
+# usual leading fmt/bext/iXML chunks arrive in a single read syscall
+_CHUNK_READ_BUFFER = 16384
+
 
 class WavMetadata:
     """Class for handling WAV file metadata in BWF and iXML formats."""
@@ -101,7 +115,7 @@ class WavMetadata:
                         # Check if description contains scene/take info (e.g., "S01T02" format)
                         # import re # Moved to top
                         # Look for scene/take patterns like "S01T02" or "SC01TK02"
-                        scene_take_match = re.search(r'S(?:C|CNE)?[_\s]*(\d+)[_\s]*T(?:K|AKE)?[_\s]*(\d+)', desc, re.IGNORECASE)
+                        scene_take_match = _SCENE_TAKE_RE.search(desc)
                         if scene_take_match:
                             if not metadata["Scene"]:
                                 metadata["Scene"] = scene_take_match.group(1)
@@ -230,7 +244,7 @@ class WavMetadata:
     def _dump_all_wav_chunks(self, metadata):
         """Attempt to read all WAV chunks directly to find metadata."""
         try:
-            with open(self.wav_path, 'rb') as f:
+            with open(self.wav_path, 'rb', buffering=_CHUNK_READ_BUFFER) as f:
                 # Check RIFF header
                 riff = f.read(4)
                 if riff != b'RIFF':
@@ -249,15 +263,11 @@ class WavMetadata:
                 # Read all chunks
                 while True:
                     try:
-                        chunk_id = f.read(4)
-                        if not chunk_id or len(chunk_id) < 4:
-                            break  # End of file
-                        
-                        chunk_size_bytes = f.read(4)
-                        if not chunk_size_bytes or len(chunk_size_bytes) < 4:
+                        header = f.read(_CHUNK_HEADER.size)
+                        if len(header) < _CHUNK_HEADER.size:
                             break  # End of file or corrupted
                         
-                        chunk_size = struct.unpack('<I', chunk_size_bytes)[0]
+                        chunk_id, chunk_size = _CHUNK_HEADER.unpack(header)
                         print(f"  Found chunk: {chunk_id} (size: {chunk_size} bytes)")
                         
                         # Special handling for known metadata chunks
@@ -300,21 +310,17 @@ class WavMetadata:
             print(f"  BEXT originator reference: {orig_ref}")
             
             # Look for scene/take in description or originator reference
-            # import re # Moved to top
+            bext_text = description + " " + originator + " " + orig_ref
             
             # Look for show information
             if not metadata["Show"]:
-                show_match = re.search(r'(?:SHOW|PROGRAM|SERIES)[:\s]+(\w[^,;\r\n]*)', 
-                                    description + " " + originator + " " + orig_ref,
-                                    re.IGNORECASE)
+                show_match = _SHOW_RE.search(bext_text)
                 if show_match:
                     metadata["Show"] = show_match.group(1)
                     print(f"  Extracted Show from BEXT: {metadata['Show']}")
             
             # Check for scene/take format (e.g., "SC01_TK02" or "S01T02")
-            scene_take_match = re.search(r'S(?:C|CNE)?[_\s]*(\d+)[_\s]*T(?:K|AKE)?[_\s]*(\d+)', 
-                                       description + " " + originator + " " + orig_ref, 
-                                       re.IGNORECASE)
+            scene_take_match = _SCENE_TAKE_RE.search(bext_text)
             if scene_take_match:
                 if not metadata["Scene"]:
                     metadata["Scene"] = scene_take_match.group(1)
@@ -325,17 +331,13 @@ class WavMetadata:
             
             # If no direct match, look for separate Scene: and Take: labels
             if not metadata["Scene"]:
-                scene_match = re.search(r'SC(?:ENE|N)?[:\s]+(\w+)', 
-                                     description + " " + originator + " " + orig_ref,
-                                     re.IGNORECASE)
+                scene_match = _SCENE_LABEL_RE.search(bext_text)
                 if scene_match:
                     metadata["Scene"] = scene_match.group(1)
                     print(f"  Extracted Scene from BEXT label: {metadata['Scene']}")
                     
             if not metadata["Take"]:
-                take_match = re.search(r'T(?:AKE|K)?[:\s]+(\w+)', 
-                                    description + " " + originator + " " + orig_ref,
-                                    re.IGNORECASE)
+                take_match = _TAKE_LABEL_RE.search(bext_text)
                 if take_match:
                     metadata["Take"] = take_match.group(1)
                     print(f"  Extracted Take from BEXT label: {metadata['Take']}")
@@ -475,12 +477,8 @@ class WavMetadata:
             pos = 0
             while pos < len(info_data) - 8:  # Need at least 8 bytes for ID + size
                 try:
-                    list_id = info_data[pos:pos+4]
-                    pos += 4
-                    
-                    list_size_bytes = info_data[pos:pos+4]
-                    list_size = struct.unpack('<I', list_size_bytes)[0]
-                    pos += 4
+                    list_id, list_size = _CHUNK_HEADER.unpack_from(info_data, pos)
+                    pos += _CHUNK_HEADER.size
                     
                     if list_size > 0 and pos + list_size <= len(info_data):
                         list_data = info_data[pos:pos+list_size]
@@ -494,21 +492,18 @@ class WavMetadata:
                             # import re # Moved to top
                             
                             # Look for show label
-                            show_match = re.search(r'(?:SHOW|PROGRAM|SERIES)[:\s]+(\w[^,;\r\n]*)', 
-                                              list_text, re.IGNORECASE)
+                            show_match = _SHOW_RE.search(list_text)
                             if show_match and not metadata["Show"]:
                                 metadata["Show"] = show_match.group(1).strip()
                                 print(f"  Extracted Show from INFO: {metadata['Show']}")
                             
                             # Look for category and subcategory labels
-                            cat_match = re.search(r'(?:CAT(?:EGORY)?|TYPE)[:\s]+(\w[^,;\r\n]*)', 
-                                              list_text, re.IGNORECASE)
+                            cat_match = _CATEGORY_RE.search(list_text)
                             if cat_match and not metadata["Category"]:
                                 metadata["Category"] = cat_match.group(1).strip()
                                 print(f"  Extracted Category from INFO: {metadata['Category']}")
                                 
-                            subcat_match = re.search(r'(?:SUB(?:CAT(?:EGORY)?)?|SUBTYPE)[:\s]+(\w[^,;\r\n]*)', 
-                                                 list_text, re.IGNORECASE)
+                            subcat_match = _SUBCATEGORY_RE.search(list_text)
                             if subcat_match and not metadata["Subcategory"]:
                                 metadata["Subcategory"] = subcat_match.group(1).strip()
                                 print(f"  Extracted Subcategory from INFO: {metadata['Subcategory']}")
@@ -614,6 +609,27 @@ def read_wav_metadata(file_path, debug=False):
         }
 
 
+def iter_wav_files(root, recursive=True, onerror=None):
+    """Yield the paths of the .wav files (any case) in root, and below it if recursive.
+
+    Uses os.scandir directly so each entry's type comes from the directory
+    listing itself. Like os.walk, it does not descend into symlinked
+    directories and skips directories it cannot read, passing the OSError
+    to onerror if one is given.
+    """
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        yield from iter_wav_files(entry.path, recursive, onerror)
+                elif entry.name.lower().endswith('.wav') and entry.is_file():
+                    yield entry.path
+    except OSError as e:
+        if onerror is not None:
+            onerror(e)
+
+
 def write_wav_metadata(file_path, metadata):
     """
     Write metadata to a WAV file.